@@ -2,14 +2,11 @@
 """A minimal text-based dungeon crawler."""
 
 import random
+import sys
 import textwrap
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
 try:
     from colorama import init as colorama_init, Fore, Style
     colorama_init()
@@ -20,26 +17,53 @@ except ImportError:  # colour is optional
 
     Fore = Style = _Dummy()
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
 # Directions used in the dungeon
 DIRECTIONS = ("north", "south", "east", "west")
-
-@dataclass
+_DIR_IDX = {d: i for i, d in enumerate(DIRECTIONS)}
+
+# Shared generator; a bound instance skips the module attribute lookup
+# the random.* functions pay on every call.
+_rng = random.Random()
+
+# Fixed message templates with the colour codes baked in at import time,
+# filled with %-formatting on the hot paths.
+_MSG_MOVE = Fore.GREEN + "You move %s." + Style.RESET_ALL + "\n"
+_MSG_NOGO = Fore.YELLOW + "You can't go that way." + Style.RESET_ALL + "\n"
+_MSG_HIT = Fore.YELLOW + "You hit the %s! It has %d hp left." + Style.RESET_ALL + "\n"
+_MSG_ENEMY = Fore.RED + "A %s is here!" + Style.RESET_ALL
+
+# Playable classes and their starting (hp, atk)
+_ROLES = frozenset(("warrior", "wizard", "rogue"))
+_ROLE_STATS = {
+    "warrior": (15, 3),
+    "wizard": (10, 4),
+    "rogue": (12, 3),
+}
+
+@dataclass(slots=True, eq=False)
 class Room:
     """A location in the dungeon."""
 
     name: str
     description: str
-    neighbors: Dict[str, "Room"] = field(default_factory=dict)
+    # One slot per direction in DIRECTIONS order, None where there is
+    # no exit; indexed through _DIR_IDX so movement skips dict hashing.
+    neighbor_arr: List["Room | None"] = field(default_factory=lambda: [None] * 4)
+    # Frozen views of the (immutable after _build_rooms) exits,
+    # so hot paths avoid rebuilding lists from them every turn.
+    neighbor_keys: Tuple[str, ...] = ()
+    neighbor_values: Tuple["Room", ...] = ()
+    # Description lines and exits are immutable too, so wrap/join them
+    # once at build time rather than on every look.
+    wrapped_desc: Tuple[str, ...] = ()
+    exits_line: str = ""
+    header: str = ""
 
     def connect(self, direction: str, other: "Room") -> None:
         """Connect this room to another in the given direction."""
-        self.neighbors[direction] = other
+        self.neighbor_arr[_DIR_IDX[direction]] = other
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """The player's avatar."""
 
@@ -49,7 +73,7 @@ class Character:
     atk: int
     room: Room | None = None
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     """A simple hostile creature."""
 
@@ -61,10 +85,13 @@ class Enemy:
     def is_alive(self) -> bool:
         return self.hp > 0
 
-    def move(self) -> None:
-        """Move to a random neighboring room."""
-        if self.room.neighbors:
-            self.room = random.choice(list(self.room.neighbors.values()))
+    def move(self, enemies_by_room: Dict[Room, List["Enemy"]]) -> None:
+        """Move to a random neighboring room, keeping the room index current."""
+        nv = self.room.neighbor_values
+        if nv:
+            enemies_by_room[self.room].remove(self)
+            self.room = nv[_rng.randrange(len(nv))]
+            enemies_by_room.setdefault(self.room, []).append(self)
 
 class Game:
     """Main game controller."""
@@ -73,15 +100,17 @@ class Game:
         self.rooms = self._build_rooms()
         self.player = self._create_player()
         self.enemies = self._spawn_enemies()
-<<<<<<< HEAD
-
-    def _build_rooms(self) -> Dict[str, Room]:
-
-=======
         self.turn = 0  # count turns so enemies wait on the first move
+        # One-word commands dispatch through this table; "go" and
+        # "quit"/"exit" are special-cased in _process_command.
+        self._commands = {
+            "attack": self._attack,
+            "look": self._describe_room,
+            "stats": self._show_stats,
+            "help": self._print_help,
+        }
 
     def _build_rooms(self) -> Dict[str, Room]:
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
         entrance = Room(
             "Entrance",
             "You stand at the moss-covered mouth of an ancient dungeon. A dark hall beckons to the north."
@@ -99,10 +128,6 @@ class Game:
             "Dusty tomes fill towering shelves, their wisdom long forgotten."
         )
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
         entrance.connect("north", hall)
         hall.connect("south", entrance)
         hall.connect("east", armory)
@@ -110,6 +135,15 @@ class Game:
         armory.connect("west", hall)
         library.connect("east", hall)
 
+        for room in (entrance, hall, armory, library):
+            room.neighbor_keys = tuple(
+                d for d, r in zip(DIRECTIONS, room.neighbor_arr) if r is not None
+            )
+            room.neighbor_values = tuple(r for r in room.neighbor_arr if r is not None)
+            room.wrapped_desc = tuple(textwrap.wrap(room.description, width=60))
+            room.exits_line = "Exits: " + ", ".join(room.neighbor_keys)
+            room.header = Fore.CYAN + f"\n== {room.name} ==" + Style.RESET_ALL
+
         return {
             "entrance": entrance,
             "hall": hall,
@@ -118,17 +152,9 @@ class Game:
         }
 
     def _create_player(self) -> Character:
-<<<<<<< HEAD
-
-        """Prompt for a name and class, ensuring clear prompts on Windows."""
-        print("Welcome to SimpleMUD, a short offline dungeon crawl.")
-        print("Strange whispers echo from somewhere below...", flush=True)
-
-=======
         """Prompt for a name and class, ensuring clear prompts on Windows."""
         print("Welcome to SimpleMUD, a short offline dungeon crawl.")
         print("Strange whispers echo from somewhere below...", flush=True)
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
         print("Let's create your character.", flush=True)
         name = ""
         while not name:
@@ -136,169 +162,131 @@ class Game:
         print(flush=True)  # put the next prompt on a new line for clarity
 
         role = ""
-        while role not in {"warrior", "wizard", "rogue"}:
+        while role not in _ROLES:
             role = input("Choose a class (warrior/wizard/rogue): ").strip().lower()
-        stats = {
-            "warrior": (15, 3),
-            "wizard": (10, 4),
-            "rogue": (12, 3),
-        }
-        hp, atk = stats[role]
+        hp, atk = _ROLE_STATS[role]
         player = Character(name, role, hp, atk)
         player.room = self.rooms["entrance"]
         return player
 
     def _spawn_enemies(self) -> List[Enemy]:
-        return [
+        enemies = [
             Enemy("Goblin", 5, 2, self.rooms["hall"]),
             Enemy("Skeleton", 5, 2, self.rooms["armory"]),
         ]
+        # Room -> living enemies, kept current as enemies move and die so
+        # lookups stay O(1) instead of scanning every enemy per turn.
+        self.enemies_by_room: Dict[Room, List[Enemy]] = {}
+        for e in enemies:
+            self.enemies_by_room.setdefault(e.room, []).append(e)
+        self.alive_count = len(enemies)
+        return enemies
 
     def _living_enemies_in_room(self, room: Room) -> List[Enemy]:
-        return [e for e in self.enemies if e.room == room and e.is_alive()]
+        return self.enemies_by_room.get(room, [])
+
+    def _render_room(self, r: Room) -> str:
+        """Assemble the full room frame as one string."""
+        parts = [r.header]
+        parts.extend(r.wrapped_desc)
+        if r.neighbor_keys:
+            parts.append(r.exits_line)
+        for e in self._living_enemies_in_room(r):
+            parts.append(_MSG_ENEMY % e.name)
+        return "\n".join(parts) + "\n"
 
     def _describe_room(self) -> None:
         r = self.player.room
         if not r:
             return
-<<<<<<< HEAD
-
-        print(Fore.CYAN + f"\n== {r.name} ==" + Style.RESET_ALL)
-
-=======
-        print(Fore.CYAN + f"\n== {r.name} ==" + Style.RESET_ALL)
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
-        for line in textwrap.wrap(r.description, width=60):
-            print(line)
-        if r.neighbors:
-            print("Exits:", ", ".join(r.neighbors.keys()))
-        for e in self._living_enemies_in_room(r):
-<<<<<<< HEAD
-
-            print(Fore.RED + f"A {e.name} is here!" + Style.RESET_ALL)
-
+        sys.stdout.write(self._render_room(r))
 
     def _move_player(self, direction: str) -> None:
-        if direction in self.player.room.neighbors:
-            self.player.room = self.player.room.neighbors[direction]
-
-=======
-            print(Fore.RED + f"A {e.name} is here!" + Style.RESET_ALL)
-
-    def _move_player(self, direction: str) -> None:
-        if direction in self.player.room.neighbors:
-            self.player.room = self.player.room.neighbors[direction]
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
-            print(Fore.GREEN + f"You move {direction}." + Style.RESET_ALL)
+        idx = _DIR_IDX.get(direction, -1)
+        nxt = self.player.room.neighbor_arr[idx] if idx >= 0 else None
+        if nxt is not None:
+            self.player.room = nxt
+            sys.stdout.write(_MSG_MOVE % direction)
         else:
-            print(Fore.YELLOW + "You can't go that way." + Style.RESET_ALL)
-
-<<<<<<< HEAD
+            sys.stdout.write(_MSG_NOGO)
 
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
     def _attack(self) -> None:
         enemies = self._living_enemies_in_room(self.player.room)
         if enemies:
             target = enemies[0]
             target.hp -= self.player.atk
-<<<<<<< HEAD
-
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
-            print(Fore.YELLOW + f"You hit the {target.name}! It has {target.hp} hp left." + Style.RESET_ALL)
+            sys.stdout.write(_MSG_HIT % (target.name, target.hp))
             if target.hp <= 0:
+                self.enemies_by_room[target.room].remove(target)
+                self.alive_count -= 1
                 print(Fore.GREEN + f"The {target.name} is defeated!" + Style.RESET_ALL)
         else:
             print(Fore.YELLOW + "No enemy to attack." + Style.RESET_ALL)
 
-<<<<<<< HEAD
-=======
+    def _print_help(self) -> None:
+        print("Commands: go <direction>, attack, look, stats, help, quit")
+
     def _show_stats(self) -> None:
         """Display the player's current stats."""
         p = self.player
         print(Fore.CYAN + f"{p.name} the {p.role}" + Style.RESET_ALL)
         print(f"HP: {p.hp}  ATK: {p.atk}")
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
 
     def _enemy_actions(self) -> None:
+        # Bind hot attributes to locals; LOAD_FAST beats the attribute
+        # chains this loop would otherwise repeat per enemy.
+        player = self.player
+        player_room = player.room
+        enemies_by_room = self.enemies_by_room
+        red, reset = Fore.RED, Style.RESET_ALL
+        write = sys.stdout.write
+        rand = _rng.random
+        dmg_total = 0
         for e in self.enemies:
-            if not e.is_alive():
+            if e.hp <= 0:
                 continue
-            if e.room == self.player.room:
-                self.player.hp -= e.atk
-<<<<<<< HEAD
-
-                print(Fore.RED + f"The {e.name} hits you! You have {self.player.hp} hp." + Style.RESET_ALL)
-
-            else:
-=======
-                print(
-                    Fore.RED
-                    + f"The {e.name} hits you! You have {self.player.hp} hp."
-                    + Style.RESET_ALL
-                )
-            elif random.random() < 0.5:  # wander half the time when not in combat
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
-                e.move()
+            if e.room is player_room:
+                dmg_total += e.atk
+                write(f"{red}The {e.name} hits you!{reset}\n")
+            elif rand() < 0.5:  # wander half the time when not in combat
+                e.move(enemies_by_room)
+        if dmg_total:
+            player.hp -= dmg_total
+            write(f"You have {player.hp} hp.\n")
 
     def _process_command(self, cmd: str) -> bool:
-        if cmd.startswith("go "):
-            direction = cmd.split(" ", 1)[1]
-            self._move_player(direction)
-        elif cmd == "attack":
-            self._attack()
-        elif cmd == "look":
-            self._describe_room()
-<<<<<<< HEAD
-        elif cmd == "help":
-            print("Commands: go <direction>, attack, look, help, quit")
-        elif cmd == "quit":
-=======
-        elif cmd == "stats":
-            self._show_stats()
-        elif cmd == "help":
-            print("Commands: go <direction>, attack, look, stats, help, quit")
-        elif cmd in {"quit", "exit"}:
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
+        head, _, rest = cmd.partition(" ")
+        if head == "go":
+            self._move_player(rest)
+            return True
+        if cmd in ("quit", "exit"):
             return False
-        else:
+        handler = self._commands.get(cmd)
+        if handler is None:
             print('Unknown command. Type "help".')
+        else:
+            handler()
         return True
 
     def play(self) -> None:
-<<<<<<< HEAD
-
         print(Fore.CYAN + "\nWelcome to SimpleMUD! Type 'help' for commands." + Style.RESET_ALL)
-
-=======
-        print(Fore.CYAN + "\nWelcome to SimpleMUD! Type 'help' for commands." + Style.RESET_ALL)
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
         running = True
         while running and self.player.hp > 0:
             self._describe_room()
-            cmd = input("> ").strip().lower()
+            cmd = input("> ").strip()
+            # Commands are ASCII in practice; skip locale-aware casing then.
+            cmd = cmd.lower() if cmd.isascii() else cmd.casefold()
             running = self._process_command(cmd)
             if not running:
                 break
-<<<<<<< HEAD
-            self._enemy_actions()
-            if all(not e.is_alive() for e in self.enemies):
-
-=======
             self.turn += 1
             if self.turn > 1:
                 self._enemy_actions()
-            if all(not e.is_alive() for e in self.enemies):
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
+            if self.alive_count == 0:
                 print(Fore.GREEN + "You defeated all enemies. Victory!" + Style.RESET_ALL)
                 break
         if self.player.hp <= 0:
             print(Fore.RED + "You have been defeated..." + Style.RESET_ALL)
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4cqbbk-codex/build-local-mud-with-basic-dungeon-and-classes
 if __name__ == "__main__":
     Game().play()